@@ -7,31 +7,113 @@ All logic in this single file.
 """
 
 import asyncio
+import hashlib
+import io
 import json
+import mmap
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional, Any
 from urllib.request import Request, urlopen
 from urllib.error import HTTPError, URLError
 
+# Optional: reuse one async HTTP client (keep-alive) instead of urlopen per call
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# Optional: orjson for faster JSON serialization, stdlib json as fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Resolve HumanMessage once at import; dict messages are the fallback
+try:
+    from langchain_core.messages import HumanMessage as _HumanMessage
+except ImportError:
+    _HumanMessage = None
+
+
+def _user_message(content: str) -> list:
+    """Build a single-user-message list for the LLM (HumanMessage if langchain_core is present)."""
+    if _HumanMessage is not None:
+        return [_HumanMessage(content=content)]
+    return [{"role": "user", "content": content}]
+
+
+# LLM clients cached per config so repeated calls reuse one instance (and its connection pool)
+_LLM_CACHE: dict[tuple, Any] = {}
+
+
+def _get_llm(llm_config: Any) -> Any:
+    key = (
+        getattr(llm_config, "model", None),
+        getattr(llm_config, "base_url", None),
+        getattr(llm_config, "api_key", None),
+        getattr(llm_config, "temperature", None),
+    )
+    llm = _LLM_CACHE.get(key)
+    if llm is None:
+        llm = llm_config.create_llm()
+        _LLM_CACHE[key] = llm
+    return llm
+
+
+def _json_dumps_str(obj: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False)
+
+
+def _json_dumps_bytes(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def _json_loads(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+_HTTP_CLIENT: Optional[Any] = None
+
+
+def _get_http_client() -> Any:
+    """Lazily create the process-wide httpx.AsyncClient (connection reuse across LLM calls)."""
+    global _HTTP_CLIENT
+    if _HTTP_CLIENT is None:
+        _HTTP_CLIENT = httpx.AsyncClient(timeout=120)
+    return _HTTP_CLIENT
+
 # Frontmatter: split on --- and parse key: value (minimal, no pyyaml)
 def _parse_frontmatter(content: str) -> tuple[dict, str]:
     """Parse YAML frontmatter between first --- and second ---. Return (frontmatter_dict, body)."""
-    if not content.strip().startswith("---"):
-        return {}, content
-    parts = content.split("---", 2)
-    if len(parts) < 3:
+    # Locate delimiters with find() and slice, instead of split("---", 2) copies
+    head = 0
+    if not content.startswith("---"):
+        stripped = content.lstrip()
+        if not stripped.startswith("---"):
+            return {}, content
+        head = len(content) - len(stripped)
+    start = content.find("---", head) + 3
+    end = content.find("---", start)
+    if end == -1:
         return {}, content
-    front = parts[1]
-    body = parts[2].lstrip("\n")
+    front = content[start:end]
+    body = content[end + 3:].lstrip("\n")
     fm = {}
     for line in front.splitlines():
         line = line.strip()
         if not line or line.startswith("#"):
             continue
-        if ":" in line:
-            k, v = line.split(":", 1)
+        k, sep, v = line.partition(":")
+        if sep:
             fm[k.strip()] = v.strip().strip("'\"").strip('"')
     return fm, body
 
@@ -44,6 +126,13 @@ class LocalSkill:
     description: str
     content: str  # full markdown (body)
     file_path: str
+    # Token sets for keyword matching, computed once at construction (not per prompt)
+    desc_tokens: frozenset = field(init=False, repr=False, compare=False, default=frozenset())
+    name_tokens: frozenset = field(init=False, repr=False, compare=False, default=frozenset())
+
+    def __post_init__(self):
+        self.desc_tokens = frozenset(_text_tokens(self.description))
+        self.name_tokens = frozenset(_text_tokens(self.name))
 
 
 @dataclass
@@ -75,27 +164,104 @@ def parse_skill_md(file_path: Path, skill_id: str) -> Optional[LocalSkill]:
     )
 
 
-def load_skills_dir(skills_dir: str) -> list[LocalSkill]:
+def _iter_skill_md(path: str):
+    """Recursively yield SKILL.md file paths via os.scandir, one directory pass each (skips symlinks)."""
+    try:
+        entries = os.scandir(path)
+    except OSError:
+        return
+    skill_md = None
+    subdirs = []
+    with entries:
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif entry.name == "SKILL.md" and entry.is_file(follow_symlinks=False):
+                    skill_md = entry.path
+            except OSError:
+                continue
+    if skill_md:
+        yield skill_md
+    for d in subdirs:
+        yield from _iter_skill_md(d)
+
+
+# Parsed-skill cache: skips re-reading SKILL.md files whose (mtime_ns, size) is unchanged
+_SKILLS_CACHE_NAME = ".skills_cache.json"
+_SKILL_FIELDS = ("id", "name", "description", "content", "file_path")
+
+
+def _read_skills_cache(root: Path) -> dict:
+    try:
+        with open(root / _SKILLS_CACHE_NAME, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+        return cache if isinstance(cache, dict) else {}
+    except Exception:
+        return {}
+
+
+def _write_skills_cache(root: Path, cache: dict) -> None:
+    """Write cache atomically (tmp + os.replace); best-effort, failures are ignored."""
+    tmp = root / (_SKILLS_CACHE_NAME + ".tmp")
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(cache, f, ensure_ascii=False)
+        os.replace(tmp, root / _SKILLS_CACHE_NAME)
+    except OSError:
+        pass
+
+
+def load_skills_dir(skills_dir: str, use_cache: bool = True) -> list[LocalSkill]:
     """Scan skills_dir for directories containing SKILL.md; parse and return list of LocalSkill."""
     root = Path(skills_dir).resolve()
     if not root.is_dir():
         return []
-    skills: list[LocalSkill] = []
-    for d in root.rglob("*"):
-        if not d.is_dir():
+    root_str = str(root)
+    cache = _read_skills_cache(root) if use_cache else {}
+    fresh_cache: dict = {}
+    cached_skills: list[LocalSkill] = []
+    # Collect (path, skill_id) pairs first, then read/parse misses in parallel (I/O-bound)
+    to_parse: list[tuple[Path, str]] = []
+    for skill_md in _iter_skill_md(root_str):
+        d = os.path.dirname(skill_md)
+        if d == root_str:
             continue
-        skill_md = d / "SKILL.md"
-        if not skill_md.is_file():
-            continue
-        try:
-            rel = d.relative_to(root)
-            skill_id = str(rel).replace("\\", "/")
-        except ValueError:
-            continue
-        s = parse_skill_md(skill_md, skill_id)
-        if s:
-            skills.append(s)
-    return skills
+        skill_id = os.path.relpath(d, root_str).replace(os.sep, "/")
+        if use_cache:
+            try:
+                st = os.stat(skill_md)
+            except OSError:
+                continue
+            entry = cache.get(skill_md)
+            if entry and entry.get("mtime_ns") == st.st_mtime_ns and entry.get("size") == st.st_size:
+                fresh_cache[skill_md] = entry
+                data = entry.get("skill")
+                if data:
+                    cached_skills.append(LocalSkill(**{k: data.get(k, "") for k in _SKILL_FIELDS}))
+                continue
+            fresh_cache[skill_md] = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "skill": None}
+        to_parse.append((Path(skill_md), skill_id))
+
+    parsed_skills: list[LocalSkill] = []
+    if len(to_parse) == 1:
+        s = parse_skill_md(*to_parse[0])
+        parsed_skills = [s] if s else []
+    elif to_parse:
+        max_workers = min(32, (os.cpu_count() or 1) * 4, len(to_parse))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            parsed = executor.map(lambda args: parse_skill_md(*args), to_parse)
+            parsed_skills = [s for s in parsed if s]
+
+    if use_cache:
+        for s in parsed_skills:
+            entry = fresh_cache.get(s.file_path)
+            if entry is not None:
+                entry["skill"] = {k: getattr(s, k) for k in _SKILL_FIELDS}
+        if fresh_cache != cache:
+            _write_skills_cache(root, fresh_cache)
+
+    return cached_skills + parsed_skills
 
 
 def build_skill_tree(skills: list[LocalSkill], skills_dir: str) -> SkillTreeNode:
@@ -103,50 +269,154 @@ def build_skill_tree(skills: list[LocalSkill], skills_dir: str) -> SkillTreeNode
     root = SkillTreeNode(name="", path="", children=[])
     by_path: dict[str, SkillTreeNode] = {"": root}
     for s in skills:
-        parts = s.id.split("/")
-        for i in range(len(parts)):
-            p = "/".join(parts[: i + 1])
-            if p not in by_path:
-                parent_path = "/".join(parts[:i]) if i else ""
-                parent = by_path.get(parent_path, root)
-                node = SkillTreeNode(name=parts[i], path=p, children=[])
+        # Walk down from root carrying the parent pointer: one lookup per level,
+        # no prefix-join rebuilds for segments that already exist
+        parent = root
+        for part in s.id.split("/"):
+            p = parent.path + "/" + part if parent.path else part
+            node = by_path.get(p)
+            if node is None:
+                node = SkillTreeNode(name=part, path=p, children=[])
                 by_path[p] = node
                 parent.children.append(node)
-        node = by_path[s.id]
-        node.skill = s
+            parent = node
+        parent.skill = s
     return root
 
 
+# Precompiled tokenizer pattern (skip the re-module cache lookup per call)
+_ASCII_RE = re.compile(r"[a-z0-9]+")
+
+
 def _text_tokens(text: str) -> set[str]:
     """Tokenize for matching: ASCII words (a-z0-9) + CJK bigrams so 登录/药店 match."""
     if not text:
         return set()
-    text_lower = text.lower()
-    tokens = set(re.findall(r"[a-z0-9]+", text_lower))
+    tokens = set(_ASCII_RE.findall(text.lower()))
     # CJK: add 2-char runs so "登录系统" -> {"登录","录系","系统"}, "登录" -> {"登录"}
-    for m in re.finditer(r"[\u4e00-\u9fff]+", text):
-        s = m.group()
-        for i in range(len(s) - 1):
-            tokens.add(s[i : i + 2])
+    # Plain range-check scan; cheaper than a regex pass for the short strings we tokenize
+    prev = ""
+    for c in text:
+        if "一" <= c <= "鿿":
+            if prev:
+                tokens.add(prev + c)
+            prev = c
+        else:
+            prev = ""
     return tokens
 
 
-def match_skills(prompt: str, skills: list[LocalSkill], top_k: int = 5) -> list[LocalSkill]:
-    """Keyword match: normalize prompt and description, score by token overlap, return top_k."""
+# Inverted index for match_skills: token -> skill indices; rebuilt when the skills list changes
+_INDEXED_SKILLS: Optional[list[LocalSkill]] = None
+_DESC_INDEX: dict[str, list[int]] = {}
+_NAME_INDEX: dict[str, list[int]] = {}
+
+
+def _ensure_match_index(skills: list[LocalSkill]) -> None:
+    """Build token -> skill-index posting lists for the given skills list (cached by identity)."""
+    global _INDEXED_SKILLS, _DESC_INDEX, _NAME_INDEX
+    if skills is _INDEXED_SKILLS:
+        return
+    desc_index: dict[str, list[int]] = {}
+    name_index: dict[str, list[int]] = {}
+    for i, s in enumerate(skills):
+        for t in s.desc_tokens:
+            desc_index.setdefault(t, []).append(i)
+        for t in s.name_tokens:
+            name_index.setdefault(t, []).append(i)
+    _DESC_INDEX, _NAME_INDEX, _INDEXED_SKILLS = desc_index, name_index, skills
+
+
+# Keyword score at or above which the match is decisive and the LLM fallback can be skipped
+DECISIVE_KEYWORD_SCORE = 2.0
+
+
+def match_skills(prompt: str, skills: list[LocalSkill], top_k: int = 5) -> tuple[list[LocalSkill], float]:
+    """Keyword match: normalize prompt and description, score by token overlap.
+
+    Returns (top_k skills, top score); callers can skip the LLM fallback when the
+    top score is at least DECISIVE_KEYWORD_SCORE.
+    """
     if not prompt or not skills:
-        return []
+        return [], 0.0
     prompt_tokens = _text_tokens(prompt)
     if not prompt_tokens:
+        return [], 0.0
+    _ensure_match_index(skills)
+    # Accumulate scores only for skills sharing at least one token with the prompt
+    scores: dict[int, float] = {}
+    for t in prompt_tokens:
+        for i in _DESC_INDEX.get(t, ()):
+            scores[i] = scores.get(i, 0.0) + 1.0
+        for i in _NAME_INDEX.get(t, ()):
+            scores[i] = scores.get(i, 0.0) + 0.5
+    ranked = sorted(scores.items(), key=lambda x: -x[1])
+    top_score = ranked[0][1] if ranked else 0.0
+    return [skills[i] for i, _ in ranked[:top_k]], top_score
+
+
+# Optional: local sentence-embedding index so the LLM fallback can be skipped entirely
+try:
+    import numpy as _np
+except ImportError:
+    _np = None
+
+_EMBED_MODEL: Optional[Any] = None
+_EMBEDDED_SKILLS: Optional[list[LocalSkill]] = None
+_SKILL_EMBS: Optional[Any] = None
+
+
+def _get_embed_model() -> Optional[Any]:
+    """Lazily load a small local embedding model (fastembed or sentence-transformers), once."""
+    global _EMBED_MODEL
+    if _EMBED_MODEL is None:
+        try:
+            from fastembed import TextEmbedding
+            _EMBED_MODEL = TextEmbedding("sentence-transformers/all-MiniLM-L6-v2")
+        except Exception:
+            try:
+                from sentence_transformers import SentenceTransformer
+                _EMBED_MODEL = SentenceTransformer("all-MiniLM-L6-v2")
+            except Exception:
+                _EMBED_MODEL = False  # neither backend available; remember that
+    return _EMBED_MODEL or None
+
+
+def _embed_texts(model: Any, texts: list[str]) -> Any:
+    """Embed texts to L2-normalized row vectors with whichever backend was loaded."""
+    if hasattr(model, "encode"):  # sentence-transformers
+        return _np.asarray(model.encode(texts, normalize_embeddings=True))
+    vecs = _np.asarray(list(model.embed(texts)))  # fastembed
+    norms = _np.linalg.norm(vecs, axis=1, keepdims=True)
+    return vecs / _np.maximum(norms, 1e-12)
+
+
+def match_skills_semantic(
+    prompt: str,
+    skills: list[LocalSkill],
+    top_k: int = 5,
+    min_score: float = 0.35,
+) -> list[LocalSkill]:
+    """
+    Cosine-similarity match against locally-computed skill embeddings (cached per skills list).
+    Returns [] when no embedding backend / numpy is installed, so callers can fall through to the LLM.
+    """
+    global _EMBEDDED_SKILLS, _SKILL_EMBS
+    if not prompt or not skills or _np is None:
         return []
-    scored: list[tuple[float, LocalSkill]] = []
-    for s in skills:
-        desc_tokens = _text_tokens(s.description)
-        name_tokens = _text_tokens(s.name)
-        overlap = len(prompt_tokens & desc_tokens) + 0.5 * len(prompt_tokens & name_tokens)
-        if overlap > 0:
-            scored.append((overlap, s))
-    scored.sort(key=lambda x: -x[0])
-    return [s for _, s in scored[:top_k]]
+    model = _get_embed_model()
+    if model is None:
+        return []
+    try:
+        if skills is not _EMBEDDED_SKILLS:
+            _SKILL_EMBS = _embed_texts(model, [f"{s.description} {s.name}" for s in skills])
+            _EMBEDDED_SKILLS = skills
+        q = _embed_texts(model, [prompt])[0]
+    except Exception:
+        return []
+    scores = _SKILL_EMBS @ q
+    order = scores.argsort()[::-1][:top_k]
+    return [skills[i] for i in order if scores[i] >= min_score]
 
 
 def build_extend_system_message(matched_skills: list[LocalSkill]) -> str:
@@ -159,18 +429,58 @@ def build_extend_system_message(matched_skills: list[LocalSkill]) -> str:
     return "\n\n---\n\n".join(parts)
 
 
+# --- Persistent LLM decision cache (skills_dir/.cache/) ---
+
+def _llm_cache_read(cache_file: Path) -> dict:
+    try:
+        with open(cache_file, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except Exception:
+        return {}
+
+
+def _llm_cache_write(cache_file: Path, data: dict) -> None:
+    """Write cache atomically (tmp + os.replace); best-effort, failures are ignored."""
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache_file.with_suffix(cache_file.suffix + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp, cache_file)
+    except OSError:
+        pass
+
+
+def _llm_cache_key(*parts: str) -> str:
+    return hashlib.blake2b("|".join(parts).encode("utf-8")).hexdigest()[:16]
+
+
 async def match_skills_with_llm(
     prompt: str,
     skills: list[LocalSkill],
     llm_config: Any,
     top_k: int = 5,
+    skills_dir: Optional[str] = None,
 ) -> list[LocalSkill]:
     """
     When keyword match finds nothing, ask the LLM to pick skills by task + skill descriptions.
     Returns the list of skills the LLM selected (by id), in order, up to top_k.
+    Selections are cached under skills_dir/.cache/ keyed by normalized prompt + skill-id set.
     """
     if not prompt or not skills:
         return []
+    cache_file = None
+    cache = {}
+    cache_key = ""
+    if skills_dir:
+        cache_file = Path(skills_dir) / ".cache" / "llm_match_cache.json"
+        cache_key = _llm_cache_key(prompt.strip().lower(), ",".join(sorted(s.id for s in skills)))
+        cache = _llm_cache_read(cache_file)
+        hit = cache.get(cache_key)
+        if hit is not None:
+            by_id = {s.id: s for s in skills}
+            return [by_id[sid] for sid in hit[:top_k] if sid in by_id]
     skills_list = "\n".join(f"- {s.id}: {s.description}" for s in skills)
     system = (
         "You select which skills apply to a user's task. Reply with only the skill id(s) to use, "
@@ -183,12 +493,8 @@ async def match_skills_with_llm(
     )
     combined = f"{system}\n\n---\n\n{user}"
     text = None
-    try:
-        from langchain_core.messages import HumanMessage
-        messages = [HumanMessage(content=combined)]
-    except ImportError:
-        messages = [{"role": "user", "content": combined}]
-    llm = llm_config.create_llm()
+    messages = _user_message(combined)
+    llm = _get_llm(llm_config)
     try:
         if hasattr(llm, "ainvoke"):
             response = await llm.ainvoke(messages)
@@ -208,6 +514,9 @@ async def match_skills_with_llm(
         return []
     raw = text.strip().lower().replace(" ", "")
     if "none" in raw or not raw:
+        if cache_file is not None:
+            cache[cache_key] = []
+            _llm_cache_write(cache_file, cache)
         return []
     ids = [x.strip() for x in raw.split(",") if x.strip()]
     by_id = {s.id: s for s in skills}
@@ -215,9 +524,85 @@ async def match_skills_with_llm(
     for sid in ids[:top_k]:
         if sid in by_id and by_id[sid] not in result:
             result.append(by_id[sid])
+    if cache_file is not None:
+        cache[cache_key] = [s.id for s in result]
+        _llm_cache_write(cache_file, cache)
     return result
 
 
+async def match_skills_with_llm_batch(
+    prompts: list[str],
+    skills: list[LocalSkill],
+    llm_config: Any,
+    top_k: int = 5,
+    skills_dir: Optional[str] = None,
+) -> list[list[LocalSkill]]:
+    """
+    Batched variant of match_skills_with_llm: one LLM call for several prompts.
+    Returns one selection list per prompt, aligned with the input order.
+    """
+    if not prompts or not skills:
+        return [[] for _ in prompts]
+    if len(prompts) == 1:
+        return [await match_skills_with_llm(prompts[0], skills, llm_config, top_k, skills_dir)]
+    skills_list = "\n".join(f"- {s.id}: {s.description}" for s in skills)
+    numbered = "\n".join(f"{i}: {p}" for i, p in enumerate(prompts))
+    system = (
+        "You select which skills apply to each of several user tasks. Reply with only a JSON object "
+        'mapping each task index to comma-separated skill id(s), e.g. {"0": "login,search", "1": "none"}. '
+        "Use 'none' when no skill fits a task. Pick at most 5 per task. "
+        "Use the skill's id (the part before the colon), nothing else."
+    )
+    user = (
+        f"User tasks (index: task):\n{numbered}\n\nAvailable skills (id: description):\n{skills_list}\n\n"
+        "Which skill id(s) for each task? Reply with the JSON object only."
+    )
+    combined = f"{system}\n\n---\n\n{user}"
+    text = None
+    messages = _user_message(combined)
+    llm = _get_llm(llm_config)
+    try:
+        if hasattr(llm, "ainvoke"):
+            response = await llm.ainvoke(messages)
+        else:
+            response = await asyncio.to_thread(llm.invoke, messages)
+        text = getattr(response, "content", None) or str(response)
+    except Exception as e:
+        if "Unknown message type" in str(e) and getattr(llm_config, "base_url", None) and getattr(llm_config, "api_key", None):
+            text = await _llm_chat_http(
+                base_url=llm_config.base_url,
+                api_key=llm_config.api_key,
+                model=llm_config.model,
+                system=system,
+                user=user,
+            )
+    empty: list[list[LocalSkill]] = [[] for _ in prompts]
+    if not text:
+        return empty
+    # Extract the JSON object from the response (tolerate surrounding prose/code fences)
+    start = text.find("{")
+    end = text.rfind("}")
+    if start == -1 or end <= start:
+        return empty
+    try:
+        mapping = json.loads(text[start : end + 1])
+    except ValueError:
+        return empty
+    by_id = {s.id: s for s in skills}
+    results = empty
+    for i in range(len(prompts)):
+        raw = str(mapping.get(str(i), "")).strip().lower().replace(" ", "")
+        if not raw or "none" in raw:
+            continue
+        selected: list[LocalSkill] = []
+        for sid in raw.split(",")[:top_k]:
+            skill = by_id.get(sid)
+            if skill is not None and skill not in selected:
+                selected.append(skill)
+        results[i] = selected
+    return results
+
+
 # --- Skill-creator flow ---
 
 SKILL_CREATOR_ID = "skill-creator"
@@ -230,27 +615,70 @@ Body: Markdown instructions. Optional dirs: scripts/, references/, assets/.
 """
 
 
+# Reference files above this size are memory-mapped instead of read_text-copied
+_MMAP_THRESHOLD = 64 * 1024
+
+
+def _read_reference(f: Path) -> Optional[str]:
+    try:
+        if f.stat().st_size > _MMAP_THRESHOLD:
+            with open(f, "rb") as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                text = bytes(mm).decode("utf-8", errors="ignore")
+        else:
+            text = f.read_text(encoding="utf-8")
+        return f"\n\n--- {f.name} ---\n\n{text}"
+    except Exception:
+        return None
+
+
+# Memoized skill contents keyed by dir, validated against SKILL.md mtime
+_SKILL_CONTENT_CACHE: dict[str, tuple[int, str]] = {}
+
+
 def _load_skill_content(skill_dir: Path) -> str:
     """Load full content of a skill: SKILL.md + optional references (for context)."""
     skill_md = skill_dir / "SKILL.md"
-    if not skill_md.is_file():
+    try:
+        mtime_ns = skill_md.stat().st_mtime_ns
+    except OSError:
         return ""
-    parts = [skill_md.read_text(encoding="utf-8")]
+    cache_key = str(skill_dir)
+    cached = _SKILL_CONTENT_CACHE.get(cache_key)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    buf = io.StringIO()
+    buf.write(skill_md.read_text(encoding="utf-8"))
     refs = skill_dir / "references"
     if refs.is_dir():
-        for f in sorted(refs.iterdir()):
-            if f.suffix.lower() in (".md", ".txt"):
-                try:
-                    parts.append(f"\n\n--- {f.name} ---\n\n{f.read_text(encoding='utf-8')}")
-                except Exception:
-                    pass
-    return "\n".join(parts)
+        files = [f for f in sorted(refs.iterdir()) if f.suffix.lower() in (".md", ".txt")]
+        if len(files) == 1:
+            contents = [_read_reference(files[0])]
+        elif files:
+            # Read references in parallel; order is preserved by executor.map
+            with ThreadPoolExecutor(max_workers=min(8, len(files))) as executor:
+                contents = list(executor.map(_read_reference, files))
+        else:
+            contents = []
+        for c in contents:
+            if c is not None:
+                buf.write("\n")
+                buf.write(c)
+    content = buf.getvalue()
+    _SKILL_CONTENT_CACHE[cache_key] = (mtime_ns, content)
+    return content
+
+
+# Precompiled patterns for skill-creator response parsing / slug derivation
+_BLOCK_PAT = re.compile(r"```(?:markdown|md)?\s*\n(.*?)```", re.DOTALL)
+_SLUG_STRIP = re.compile(r"[^a-z0-9\s-]")
+_SLUG_SPACES = re.compile(r"\s+")
+_NAME_CLEAN = re.compile(r"[^a-z0-9-]")
 
 
 def _slug_from_task(task: str) -> str:
     """Derive a kebab-case skill name from task (fallback)."""
-    s = re.sub(r"[^a-z0-9\s-]", "", task.lower())
-    s = re.sub(r"\s+", "-", s).strip("-")[:64]
+    s = _SLUG_STRIP.sub("", task.lower())
+    s = _SLUG_SPACES.sub("-", s).strip("-")[:64]
     return s or "generated-skill"
 
 
@@ -266,8 +694,7 @@ def _parse_skill_creator_response(response: str, fallback_name: str) -> dict[str
     extra_files: list[dict[str, str]] = []
 
     # Try to find ```markdown or ``` SKILL.md block
-    block_pat = re.compile(r"```(?:markdown|md)?\s*\n(.*?)```", re.DOTALL)
-    blocks = block_pat.findall(response)
+    blocks = _BLOCK_PAT.findall(response)
     if blocks:
         full_content = blocks[0].strip()
         if "---" in full_content:
@@ -282,10 +709,10 @@ def _parse_skill_creator_response(response: str, fallback_name: str) -> dict[str
         body = response.strip()
         first_line = body.split("\n")[0].strip()
         if first_line.startswith("#"):
-            name = re.sub(r"[^a-z0-9-]", "", first_line.replace(" ", "-").lower())[:64] or fallback_name
+            name = _NAME_CLEAN.sub("", first_line.replace(" ", "-").lower())[:64] or fallback_name
 
     # Normalize name to agentskills spec
-    name = re.sub(r"[^a-z0-9-]", "", name.lower()).strip("-") or fallback_name
+    name = _NAME_CLEAN.sub("", name.lower()).strip("-") or fallback_name
     name = name[:64]
 
     return {
@@ -313,18 +740,24 @@ async def _llm_chat_http(
         ],
         "temperature": 0.0,
     }
-    data = json.dumps(body).encode("utf-8")
-    req = Request(url, data=data, method="POST", headers={
+    headers = {
         "Content-Type": "application/json",
         "Authorization": f"Bearer {api_key}",
-    })
+    }
+    data = _json_dumps_bytes(body)
+    if httpx is not None:
+        response = await _get_http_client().post(url, content=data, headers=headers)
+        response.raise_for_status()
+        resp = _json_loads(response.content)
+    else:
+        # Fallback: stdlib urlopen in a worker thread (new connection per call)
+        req = Request(url, data=data, method="POST", headers=headers)
 
-    def _do_request():
-        with urlopen(req, timeout=120) as resp:
-            out = json.loads(resp.read().decode("utf-8"))
-        return out
+        def _do_request():
+            with urlopen(req, timeout=120) as r:
+                return _json_loads(r.read())
 
-    resp = await asyncio.to_thread(_do_request)
+        resp = await asyncio.to_thread(_do_request)
     choice = (resp.get("choices") or [None])[0]
     if not choice:
         raise RuntimeError("No choices in LLM response")
@@ -334,11 +767,10 @@ async def _llm_chat_http(
 
 def _format_recorded_actions_for_prompt(test_case_dict: dict) -> str:
     """Format recorded test case (id, name, description, start_url, actions) for skill-creator prompt."""
-    lines = []
-    lines.append(f"Test case name: {test_case_dict.get('name', '')}")
-    lines.append(f"Description: {test_case_dict.get('description', '')}")
-    lines.append(f"Start URL: {test_case_dict.get('start_url', '') or '(none)'}")
-    lines.append("")
+    buf = io.StringIO()
+    buf.write(f"Test case name: {test_case_dict.get('name', '')}\n")
+    buf.write(f"Description: {test_case_dict.get('description', '')}\n")
+    buf.write(f"Start URL: {test_case_dict.get('start_url', '') or '(none)'}\n\n")
     actions = test_case_dict.get("actions") or []
     for i, a in enumerate(actions):
         if isinstance(a, dict):
@@ -350,15 +782,15 @@ def _format_recorded_actions_for_prompt(test_case_dict: dict) -> str:
             params = a.get("parameters") or {}
             # Omit internal or huge keys for cleaner prompt
             params_clean = {k: v for k, v in params.items() if k != "_element" and not (isinstance(v, str) and len(v) > 200)}
-            lines.append(f"Step {step}: [{atype}] {aname}")
+            buf.write(f"Step {step}: [{atype}] {aname}\n")
             if elem:
-                lines.append(f"  element: {elem}")
+                buf.write(f"  element: {elem}\n")
             if goal:
-                lines.append(f"  goal: {goal}")
+                buf.write(f"  goal: {goal}\n")
             if params_clean:
-                lines.append(f"  parameters: {json.dumps(params_clean, ensure_ascii=False)}")
-            lines.append("")
-    return "\n".join(lines).strip()
+                buf.write(f"  parameters: {_json_dumps_str(params_clean)}\n")
+            buf.write("\n")
+    return buf.getvalue().strip()
 
 
 async def run_skill_creator_from_record(
@@ -401,12 +833,8 @@ async def run_skill_creator_from_record(
 
     combined = f"{system}\n\n---\n\n{user_prompt}"
     text = None
-    try:
-        from langchain_core.messages import HumanMessage
-        messages = [HumanMessage(content=combined)]
-    except ImportError:
-        messages = [{"role": "user", "content": combined}]
-    llm = llm_config.create_llm()
+    messages = _user_message(combined)
+    llm = _get_llm(llm_config)
     try:
         if hasattr(llm, "ainvoke"):
             response = await llm.ainvoke(messages)
@@ -478,18 +906,12 @@ async def run_skill_creator(
         "Output the full SKILL.md inside a markdown code block."
     )
 
-    llm = llm_config.create_llm()
+    llm = _get_llm(llm_config)
     # Some backends (e.g. OpenRouter/Gemini) accept only HumanMessage, not SystemMessage or dict
     combined = f"{system}\n\n---\n\n{user_prompt}"
     text = None
-    # Try LangChain LLM first
-    try:
-        from langchain_core.messages import HumanMessage
-        messages = [HumanMessage(content=combined)]
-    except ImportError:
-        messages = [{"role": "user", "content": combined}]
+    messages = _user_message(combined)
     try:
-        llm = llm_config.create_llm()
         if hasattr(llm, "ainvoke"):
             response = await llm.ainvoke(messages)
         else:
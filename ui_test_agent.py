@@ -10,22 +10,60 @@ Features:
 """
 
 import asyncio
+import functools
 import json
+import logging
+import logging.handlers
 import os
 import re
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Any
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 from enum import Enum
 
 from dotenv import load_dotenv
 from browser_use import Agent, Browser, BrowserProfile, ChatOpenAI
 
+# Optional: orjson for faster test-case JSON encode/decode, stdlib json as fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional: aiofiles for non-blocking test-case IO, thread offload as fallback
+try:
+    import aiofiles
+except ImportError:
+    aiofiles = None
+
+
+def _json_dumps_str(obj: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False)
+
+
+def _dumps_pretty(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _dumps_compact(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
 from local_skills import (
     load_skills_dir,
     build_skill_tree,
     match_skills,
+    DECISIVE_KEYWORD_SCORE,
+    match_skills_semantic,
     match_skills_with_llm,
     build_extend_system_message,
     run_skill_creator,
@@ -35,8 +73,42 @@ from local_skills import (
 
 load_dotenv()
 
-# URL pattern for extracting from prompt (http/https)
-_URL_PATTERN = re.compile(r"https?://[^\s\]\)\"\'<>]+", re.IGNORECASE)
+# URL pattern for extracting from prompt (http/https); the final character class
+# refuses trailing punctuation so matches need no rstrip afterwards
+_URL_PATTERN = re.compile(r"https?://[^\s\]\)\"\'<>]*[^\s\]\)\"\'<>.,;:]", re.IGNORECASE)
+
+# Persistent cache for LLM-inferred start URLs, keyed by (model, normalized task)
+_URL_CACHE_FILE = os.path.join(".cache", "url_infer_cache.json")
+_URL_CACHE: Optional[dict] = None
+
+
+def _url_cache() -> dict:
+    global _URL_CACHE
+    if _URL_CACHE is None:
+        try:
+            with open(_URL_CACHE_FILE, encoding="utf-8") as f:
+                _URL_CACHE = json.load(f)
+        except (OSError, ValueError):
+            _URL_CACHE = {}
+    return _URL_CACHE
+
+
+def _url_cache_store(key: str, url: Optional[str]) -> None:
+    cache = _url_cache()
+    cache[key] = url
+    try:
+        os.makedirs(os.path.dirname(_URL_CACHE_FILE), exist_ok=True)
+        tmp = _URL_CACHE_FILE + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(_json_dumps_str(cache))
+        os.replace(tmp, _URL_CACHE_FILE)
+    except OSError:
+        pass
+
+
+async def _ainput(prompt: str) -> str:
+    """input() off the event loop so pending tasks keep progressing"""
+    return await asyncio.to_thread(input, prompt)
 
 
 def extract_url_from_prompt(prompt: str) -> Optional[str]:
@@ -44,7 +116,7 @@ def extract_url_from_prompt(prompt: str) -> Optional[str]:
     if not prompt or not prompt.strip():
         return None
     m = _URL_PATTERN.search(prompt)
-    return m.group(0).rstrip(".,;:") if m else None
+    return m.group(0) if m else None
 
 
 async def infer_url_from_task(task: str, llm_config: "LLMConfig") -> Optional[str]:
@@ -54,6 +126,10 @@ async def infer_url_from_task(task: str, llm_config: "LLMConfig") -> Optional[st
     """
     if not task or not task.strip():
         return None
+    cache_key = f"{llm_config.model}|{' '.join(task.split()).lower()}"
+    cache = _url_cache()
+    if cache_key in cache:
+        return cache[cache_key]
     system = (
         "You are a helper. Given a short task description for a browser automation, "
         "reply with the single most likely start URL the user wants to open, or reply 'none' if unclear. "
@@ -68,12 +144,13 @@ async def infer_url_from_task(task: str, llm_config: "LLMConfig") -> Optional[st
         else:
             response = await asyncio.to_thread(llm.invoke, messages)
     except Exception:
+        # Transient failure: don't cache, retry next run
         return None
     text = (getattr(response, "content", None) or str(response)).strip().lower()
-    if "none" in text and not _URL_PATTERN.search(text):
-        return None
     m = _URL_PATTERN.search(text)
-    return m.group(0).rstrip(".,;:") if m else None
+    url = m.group(0) if m else None
+    _url_cache_store(cache_key, url)
+    return url
 
 
 @dataclass
@@ -108,17 +185,41 @@ class LLMConfig:
         )
     
     def create_llm(self) -> Any:
-        """Create LLM instance based on configuration"""
-        kwargs = {
-            "model": self.model,
-            "temperature": self.temperature,
-        }
-        if self.api_key:
-            kwargs["api_key"] = self.api_key
-        if self.base_url:
-            kwargs["base_url"] = self.base_url
-        
-        return ChatOpenAI(**kwargs)
+        """Create (or reuse a cached) LLM instance based on configuration"""
+        return _get_llm_client(self.model, self.api_key, self.base_url, self.temperature)
+
+
+@functools.lru_cache(maxsize=1)
+def _cached_llm_config() -> LLMConfig:
+    """Environment-derived LLM config, parsed once per process.
+
+    Call _cached_llm_config.cache_clear() if the environment changes mid-run.
+    """
+    return LLMConfig.from_env()
+
+
+# Cache of LLM clients keyed by configuration; clients are stateless and safe to share
+_LLM_CLIENTS: dict[tuple, Any] = {}
+
+
+def _get_llm_client(
+    model: str,
+    api_key: Optional[str],
+    base_url: Optional[str],
+    temperature: float,
+) -> Any:
+    """Return a ChatOpenAI client for the given settings, creating it at most once"""
+    key = (model, api_key, base_url, temperature)
+    client = _LLM_CLIENTS.get(key)
+    if client is None:
+        kwargs = {"model": model, "temperature": temperature}
+        if api_key:
+            kwargs["api_key"] = api_key
+        if base_url:
+            kwargs["base_url"] = base_url
+        client = ChatOpenAI(**kwargs)
+        _LLM_CLIENTS[key] = client
+    return client
 
 
 class ActionType(str, Enum):
@@ -139,6 +240,108 @@ class ActionType(str, Enum):
     UNKNOWN = "unknown"
 
 
+_AT_UNKNOWN = ActionType.UNKNOWN.value
+
+# Enum .value resolved once for the hot comparison paths
+_AT_NAVIGATE = ActionType.NAVIGATE.value
+_AT_CLICK = ActionType.CLICK.value
+_AT_TYPE = ActionType.TYPE.value
+_AT_SCROLL = ActionType.SCROLL.value
+_AT_SEND_KEYS = ActionType.SEND_KEYS.value
+_AT_SELECT = ActionType.SELECT.value
+_AT_WAIT = ActionType.WAIT.value
+_AT_EXTRACT = ActionType.EXTRACT.value
+
+# Lookup tables for _parse_action, built once with .value pre-resolved
+_ACTION_TYPE_MAP: dict[str, str] = {
+    "navigate": ActionType.NAVIGATE.value,
+    "click": ActionType.CLICK.value,
+    "input": ActionType.TYPE.value,
+    "scroll": ActionType.SCROLL.value,
+    "scroll_to_text": ActionType.SCROLL.value,
+    "wait": ActionType.WAIT.value,
+    "screenshot": ActionType.SCREENSHOT.value,
+    "extract": ActionType.EXTRACT.value,
+    "extract_content": ActionType.EXTRACT.value,
+    "send_keys": ActionType.SEND_KEYS.value,
+    "go_back": ActionType.GO_BACK.value,
+    "go_forward": ActionType.GO_FORWARD.value,
+    "refresh": ActionType.REFRESH.value,
+    "select": ActionType.SELECT.value,
+    "select_option": ActionType.SELECT.value,
+    "upload": ActionType.UPLOAD.value,
+    "upload_file": ActionType.UPLOAD.value,
+    "done": ActionType.EXTRACT.value,
+}
+
+_CLASS_TYPE_MAP: dict[str, str] = {
+    "NavigateToUrlEvent": ActionType.NAVIGATE.value,
+    "ClickElementEvent": ActionType.CLICK.value,
+    "ClickCoordinateEvent": ActionType.CLICK.value,
+    "TypeTextEvent": ActionType.TYPE.value,
+    "InputTextEvent": ActionType.TYPE.value,
+    "ScrollEvent": ActionType.SCROLL.value,
+    "ScrollToTextEvent": ActionType.SCROLL.value,
+    "WaitEvent": ActionType.WAIT.value,
+    "ScreenshotEvent": ActionType.SCREENSHOT.value,
+    "ExtractContentEvent": ActionType.EXTRACT.value,
+    "SendKeysEvent": ActionType.SEND_KEYS.value,
+    "GoBackEvent": ActionType.GO_BACK.value,
+    "GoForwardEvent": ActionType.GO_FORWARD.value,
+    "RefreshEvent": ActionType.REFRESH.value,
+    "SelectDropdownOptionEvent": ActionType.SELECT.value,
+    "UploadFileEvent": ActionType.UPLOAD.value,
+    "DoneEvent": ActionType.EXTRACT.value,
+}
+
+
+# Per-step diagnostics go through a buffered logger so the agent hot path does
+# not pay for a stdout write on every step; _flush_step_log() drains the buffer
+# at the end of a run. User-facing CLI output stays on plain print().
+_step_logger = logging.getLogger("ui_test_agent.steps")
+if not _step_logger.handlers:
+    _stream_handler = logging.StreamHandler()
+    _stream_handler.setFormatter(logging.Formatter("%(message)s"))
+    _step_logger.addHandler(
+        logging.handlers.MemoryHandler(capacity=256, flushLevel=logging.ERROR, target=_stream_handler)
+    )
+    _step_logger.setLevel(logging.INFO)
+    _step_logger.propagate = False
+
+
+def _flush_step_log() -> None:
+    """Flush buffered per-step diagnostics to the terminal"""
+    for handler in _step_logger.handlers:
+        handler.flush()
+
+
+# Element attributes worth surfacing in descriptions, in display order
+_ATTR_KEYS = ("id", "name", "class", "value", "type")
+
+# Fixed tail of every correction prompt
+_CORRECTION_INSTRUCTIONS = """INSTRUCTIONS:
+1. The element position may have changed but the functionality should be the same
+2. Try to find the element by:
+   - Text content / label
+   - ID or name attribute
+   - Class name
+   - XPath pattern
+   - Visual position relative to other elements
+3. If it's a click action, find and click the equivalent button/link
+4. If it's an input action, find and fill the equivalent input field
+5. Report whether the correction was successful"""
+
+# Action types that never carry an interacted element
+_NO_ELEMENT_TYPES = frozenset({
+    ActionType.NAVIGATE.value,
+    ActionType.WAIT.value,
+    ActionType.SCREENSHOT.value,
+    ActionType.GO_BACK.value,
+    ActionType.GO_FORWARD.value,
+    ActionType.REFRESH.value,
+})
+
+
 @dataclass
 class RecordedAction:
     """Represents a single recorded action"""
@@ -156,13 +359,26 @@ class RecordedAction:
     goal: Optional[str] = None
     memory: Optional[str] = None
     element_description: Optional[str] = None
-    
+    # Serialized parameters, computed on first use (not persisted)
+    _params_json: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    # Static part of the correction prompt, computed on first use (not persisted)
+    _correction_prefix: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def params_json(self) -> str:
+        """Parameters as a JSON string, serialized at most once per action"""
+        if self._params_json is None:
+            self._params_json = _json_dumps_str(self.parameters)
+        return self._params_json
+
     def to_dict(self) -> dict:
-        return asdict(self)
-    
+        # All fields are primitives/None: a shallow __dict__ copy avoids asdict's deepcopy walk
+        return {k: v for k, v in self.__dict__.items() if not k.startswith("_")}
+
     @classmethod
     def from_dict(cls, data: dict) -> "RecordedAction":
-        # Handle legacy data without new fields
+        # Handle legacy data without new fields; drop anything non-init (underscore keys)
+        data = {k: v for k, v in data.items() if not k.startswith("_")}
         for field_name in ["thinking", "goal", "memory", "element_description"]:
             if field_name not in data:
                 data[field_name] = None
@@ -196,9 +412,18 @@ class TestCase:
     metadata: dict = field(default_factory=dict)
     
     def to_dict(self) -> dict:
-        data = asdict(self)
-        data["actions"] = [a.to_dict() if isinstance(a, RecordedAction) else a for a in self.actions]
-        return data
+        # Build the dict directly instead of asdict() (deepcopy) + re-serializing actions twice
+        return {
+            "id": self.id,
+            "name": self.name,
+            "description": self.description,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+            "start_url": self.start_url,
+            "actions": [a.to_dict() if isinstance(a, RecordedAction) else a for a in self.actions],
+            "tags": self.tags,
+            "metadata": self.metadata,
+        }
     
     @classmethod
     def from_dict(cls, data: dict) -> "TestCase":
@@ -210,15 +435,48 @@ class TestCase:
         """Save test case to JSON file"""
         Path(directory).mkdir(parents=True, exist_ok=True)
         filepath = os.path.join(directory, f"{self.id}.json")
+        # Stream one action at a time instead of materializing the whole to_dict() payload
         with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
+            f.write("{\n")
+            for key in ("id", "name", "description", "created_at", "updated_at", "start_url"):
+                f.write(f'  "{key}": {_json_dumps_str(getattr(self, key))},\n')
+            f.write('  "actions": [')
+            for i, a in enumerate(self.actions):
+                f.write(",\n    " if i else "\n    ")
+                f.write(_json_dumps_str(a.to_dict() if isinstance(a, RecordedAction) else a))
+            f.write("\n  ],\n" if self.actions else "],\n")
+            f.write(f'  "tags": {_json_dumps_str(self.tags)},\n')
+            f.write(f'  "metadata": {_json_dumps_str(self.metadata)}\n')
+            f.write("}\n")
         return filepath
-    
+
     @classmethod
     def load(cls, filepath: str) -> "TestCase":
         """Load test case from JSON file"""
-        with open(filepath, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(filepath, "rb") as f:
+            raw = f.read()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        return cls.from_dict(data)
+
+    async def asave(self, directory: str = "test_cases") -> str:
+        """Async variant of save(); non-blocking write via aiofiles when available"""
+        if aiofiles is None:
+            return await asyncio.to_thread(self.save, directory)
+        Path(directory).mkdir(parents=True, exist_ok=True)
+        filepath = os.path.join(directory, f"{self.id}.json")
+        payload = _json_dumps_str(self.to_dict())
+        async with aiofiles.open(filepath, "w", encoding="utf-8") as f:
+            await f.write(payload)
+        return filepath
+
+    @classmethod
+    async def aload(cls, filepath: str) -> "TestCase":
+        """Async variant of load(); non-blocking read via aiofiles when available"""
+        if aiofiles is None:
+            return await asyncio.to_thread(cls.load, filepath)
+        async with aiofiles.open(filepath, "rb") as f:
+            raw = await f.read()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
         return cls.from_dict(data)
 
 
@@ -228,33 +486,104 @@ class TestCaseManager:
     def __init__(self, directory: str = "test_cases"):
         self.directory = directory
         Path(directory).mkdir(parents=True, exist_ok=True)
-    
+        # Parsed TestCase objects keyed by filename, validated against st_mtime_ns
+        self._cache: dict[str, tuple[int, TestCase]] = {}
+
     def list_test_cases(self) -> list[TestCase]:
         """List all saved test cases"""
         test_cases = []
-        for filename in os.listdir(self.directory):
-            if filename.endswith(".json"):
-                filepath = os.path.join(self.directory, filename)
+        to_parse: list[tuple[str, str, int]] = []  # (name, path, mtime_ns)
+        for entry in os.scandir(self.directory):
+            if not entry.name.endswith(".json"):
+                continue
+            try:
+                mtime_ns = entry.stat().st_mtime_ns
+            except OSError:
+                continue
+            cached = self._cache.get(entry.name)
+            if cached is not None and cached[0] == mtime_ns:
+                test_cases.append(cached[1])
+            else:
+                to_parse.append((entry.name, entry.path, mtime_ns))
+
+        if to_parse:
+            def _load(item):
                 try:
-                    test_cases.append(TestCase.load(filepath))
+                    return TestCase.load(item[1])
                 except Exception as e:
-                    print(f"Warning: Failed to load {filename}: {e}")
+                    print(f"Warning: Failed to load {item[0]}: {e}")
+                    return None
+
+            if len(to_parse) == 1:
+                loaded = [_load(to_parse[0])]
+            else:
+                workers = min(32, (os.cpu_count() or 1) * 4, len(to_parse))
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    loaded = list(pool.map(_load, to_parse))
+            for (name, _path, mtime_ns), tc in zip(to_parse, loaded):
+                if tc is None:
+                    continue
+                self._cache[name] = (mtime_ns, tc)
+                test_cases.append(tc)
+
         return sorted(test_cases, key=lambda x: x.created_at, reverse=True)
     
+    async def alist_test_cases(self) -> list[TestCase]:
+        """Async variant of list_test_cases(); loads cache misses concurrently"""
+        test_cases = []
+        to_parse: list[tuple[str, str, int]] = []  # (name, path, mtime_ns)
+        for entry in os.scandir(self.directory):
+            if not entry.name.endswith(".json"):
+                continue
+            try:
+                mtime_ns = entry.stat().st_mtime_ns
+            except OSError:
+                continue
+            cached = self._cache.get(entry.name)
+            if cached is not None and cached[0] == mtime_ns:
+                test_cases.append(cached[1])
+            else:
+                to_parse.append((entry.name, entry.path, mtime_ns))
+
+        if to_parse:
+            loaded = await asyncio.gather(
+                *(TestCase.aload(path) for _name, path, _m in to_parse),
+                return_exceptions=True,
+            )
+            for (name, _path, mtime_ns), tc in zip(to_parse, loaded):
+                if isinstance(tc, BaseException):
+                    print(f"Warning: Failed to load {name}: {tc}")
+                    continue
+                self._cache[name] = (mtime_ns, tc)
+                test_cases.append(tc)
+
+        return sorted(test_cases, key=lambda x: x.created_at, reverse=True)
+
     def get_test_case(self, test_id: str) -> Optional[TestCase]:
         """Get a specific test case by ID"""
         filepath = os.path.join(self.directory, f"{test_id}.json")
-        if os.path.exists(filepath):
+        try:
             return TestCase.load(filepath)
-        return None
-    
+        except FileNotFoundError:
+            return None
+
+    async def aget_test_case(self, test_id: str) -> Optional[TestCase]:
+        """Async variant of get_test_case()"""
+        filepath = os.path.join(self.directory, f"{test_id}.json")
+        try:
+            return await TestCase.aload(filepath)
+        except FileNotFoundError:
+            return None
+
     def delete_test_case(self, test_id: str) -> bool:
         """Delete a test case by ID"""
         filepath = os.path.join(self.directory, f"{test_id}.json")
-        if os.path.exists(filepath):
+        self._cache.pop(f"{test_id}.json", None)
+        try:
             os.remove(filepath)
-            return True
-        return False
+        except FileNotFoundError:
+            return False
+        return True
     
     def search_test_cases(self, query: str) -> list[TestCase]:
         """Search test cases by name or description"""
@@ -275,92 +604,67 @@ class UITestRecorder:
         llm_config: Optional[LLMConfig] = None,
         skills_dir: str = "skills",
         auto_skills: bool = True,
+        skill_cache: bool = True,
     ):
         self.headless = headless
         self.test_cases_dir = test_cases_dir
         self.llm_config = llm_config or LLMConfig.from_env()
         self.skills_dir = skills_dir
         self.auto_skills = auto_skills
+        self.skill_cache = skill_cache
         self.recorded_actions: list[RecordedAction] = []
         self.current_step = 0
         self.current_url = ""
+        self._seen_history_len = 0
         self.screenshots_dir = "screenshots"
         Path(self.screenshots_dir).mkdir(parents=True, exist_ok=True)
-    
+        # Browser is created lazily and reused across record() calls
+        self._browser: Optional[Browser] = None
+
+    def _get_browser(self) -> Browser:
+        """Return the shared browser, creating it on first use"""
+        if self._browser is None:
+            self._browser = Browser(headless=self.headless)
+        return self._browser
+
+    async def close(self):
+        """Stop the shared browser if it was started"""
+        if self._browser is not None:
+            browser, self._browser = self._browser, None
+            await browser.stop()
+
     def _parse_action(self, action) -> tuple[str, str, dict]:
         """Parse an action object to extract type, name and parameters"""
-        # Map action names to our action types
-        action_type_map = {
-            "navigate": ActionType.NAVIGATE,
-            "click": ActionType.CLICK,
-            "input": ActionType.TYPE,
-            "scroll": ActionType.SCROLL,
-            "scroll_to_text": ActionType.SCROLL,
-            "wait": ActionType.WAIT,
-            "screenshot": ActionType.SCREENSHOT,
-            "extract": ActionType.EXTRACT,
-            "extract_content": ActionType.EXTRACT,
-            "send_keys": ActionType.SEND_KEYS,
-            "go_back": ActionType.GO_BACK,
-            "go_forward": ActionType.GO_FORWARD,
-            "refresh": ActionType.REFRESH,
-            "select": ActionType.SELECT,
-            "select_option": ActionType.SELECT,
-            "upload": ActionType.UPLOAD,
-            "upload_file": ActionType.UPLOAD,
-            "done": ActionType.EXTRACT,
-        }
-        
         # Handle dict objects (from model_actions())
         if isinstance(action, dict):
-            # Look for action keys in the dict
-            for key in action_type_map.keys():
-                if key in action:
-                    action_name = key
-                    action_params = action[key] if isinstance(action[key], dict) else {}
-                    # Include interacted_element info if available
-                    if "interacted_element" in action and action["interacted_element"]:
-                        action_params["_element"] = action["interacted_element"]
-                    action_type = action_type_map.get(action_name, ActionType.UNKNOWN).value
-                    return action_type, action_name, action_params
-            
+            # Look for a known action key via key intersection (O(1) per key)
+            common = _ACTION_TYPE_MAP.keys() & action.keys()
+            action_name = next(iter(common), None)
+            if action_name is not None:
+                action_params = action[action_name] if isinstance(action[action_name], dict) else {}
+                # Include interacted_element info if available
+                if "interacted_element" in action and action["interacted_element"]:
+                    action_params["_element"] = action["interacted_element"]
+                return _ACTION_TYPE_MAP[action_name], action_name, action_params
+
             # Fallback
             for key, value in action.items():
                 if key != "interacted_element" and isinstance(value, dict):
                     action_name = key
-                    action_type = action_type_map.get(action_name.lower(), ActionType.UNKNOWN).value
+                    action_type = _ACTION_TYPE_MAP.get(action_name.lower(), _AT_UNKNOWN)
                     return action_type, action_name, value
-            
-            return ActionType.UNKNOWN.value, "unknown", action
-        
+
+            return _AT_UNKNOWN, "unknown", action
+
         # Handle Pydantic model objects
         action_name = type(action).__name__
-        class_type_map = {
-            "NavigateToUrlEvent": ActionType.NAVIGATE,
-            "ClickElementEvent": ActionType.CLICK,
-            "ClickCoordinateEvent": ActionType.CLICK,
-            "TypeTextEvent": ActionType.TYPE,
-            "InputTextEvent": ActionType.TYPE,
-            "ScrollEvent": ActionType.SCROLL,
-            "ScrollToTextEvent": ActionType.SCROLL,
-            "WaitEvent": ActionType.WAIT,
-            "ScreenshotEvent": ActionType.SCREENSHOT,
-            "ExtractContentEvent": ActionType.EXTRACT,
-            "SendKeysEvent": ActionType.SEND_KEYS,
-            "GoBackEvent": ActionType.GO_BACK,
-            "GoForwardEvent": ActionType.GO_FORWARD,
-            "RefreshEvent": ActionType.REFRESH,
-            "SelectDropdownOptionEvent": ActionType.SELECT,
-            "UploadFileEvent": ActionType.UPLOAD,
-            "DoneEvent": ActionType.EXTRACT,
-        }
-        
-        action_type = class_type_map.get(action_name, ActionType.UNKNOWN).value
-        
+        action_type = _CLASS_TYPE_MAP.get(action_name, _AT_UNKNOWN)
+
         params = {}
         try:
             if hasattr(action, "model_dump"):
-                params = action.model_dump()
+                # Skip json coercion and drop unset/None fields; smaller dict, faster dump
+                params = action.model_dump(mode="python", exclude_none=True, exclude_defaults=True)
             elif hasattr(action, "__dict__"):
                 params = {k: v for k, v in action.__dict__.items() if not k.startswith("_")}
         except Exception:
@@ -373,98 +677,99 @@ class UITestRecorder:
         element = params.get("_element")
         if not element:
             return None
-        
+
         descriptions = []
-        
+
         try:
-            # Handle both dict and object types
-            def get_attr(obj, key, default=""):
-                if isinstance(obj, dict):
-                    return obj.get(key, default)
-                return getattr(obj, key, default)
-            
-            # Get element type
-            node_name = get_attr(element, "node_name", "")
+            # Separate dict/object fast paths; no per-call closure
+            if isinstance(element, dict):
+                node_name = element.get("node_name", "")
+                attrs = element.get("attributes", {})
+                ax_name = element.get("ax_name", "")
+                xpath = element.get("x_path", "")
+            else:
+                node_name = getattr(element, "node_name", "")
+                attrs = getattr(element, "attributes", {})
+                ax_name = getattr(element, "ax_name", "")
+                xpath = getattr(element, "x_path", "")
+
+            # Element type
             if node_name:
                 descriptions.append(node_name.lower() if isinstance(node_name, str) else str(node_name))
-            
-            # Get attributes
-            attrs = get_attr(element, "attributes", {})
+
+            # Attributes
             if attrs:
                 if isinstance(attrs, dict):
-                    if attrs.get("id"):
-                        descriptions.append(f"id='{attrs['id']}'")
-                    if attrs.get("name"):
-                        descriptions.append(f"name='{attrs['name']}'")
-                    if attrs.get("class"):
-                        descriptions.append(f"class='{attrs['class']}'")
-                    if attrs.get("value"):
-                        descriptions.append(f"value='{attrs['value']}'")
-                    if attrs.get("type"):
-                        descriptions.append(f"type='{attrs['type']}'")
+                    for attr_name in _ATTR_KEYS:
+                        val = attrs.get(attr_name)
+                        if val:
+                            descriptions.append(f"{attr_name}='{val}'")
                 else:
                     # attrs might be an object
-                    for attr_name in ["id", "name", "class", "value", "type"]:
+                    for attr_name in _ATTR_KEYS:
                         val = getattr(attrs, attr_name, None)
                         if val:
                             descriptions.append(f"{attr_name}='{val}'")
-            
-            # Get accessible name (button text, etc.)
-            ax_name = get_attr(element, "ax_name", "")
+
+            # Accessible name (button text, etc.)
             if ax_name:
                 descriptions.append(f"text='{ax_name}'")
-            
-            # Get XPath
-            xpath = get_attr(element, "x_path", "")
+
+            # XPath
             if xpath:
                 descriptions.append(f"xpath='{xpath}'")
-        
-        except Exception as e:
+
+        except Exception:
             # If extraction fails, try to get string representation
             try:
                 return str(element)[:200]
-            except:
+            except Exception:
                 return None
-        
+
         return " ".join(descriptions) if descriptions else None
     
     async def _on_step_end(self, agent: Agent):
         """Hook called at the end of each agent step to record actions with thinking"""
         try:
             history = agent.history
-            if not history or len(history) == 0:
+            if not history:
                 return
-            
+            n_history = len(history)
+            if n_history == 0 or n_history == self._seen_history_len:
+                # Nothing new since the last tick; skip the model_actions() rebuild
+                return
+            self._seen_history_len = n_history
+
             # Get all model actions and thoughts
             model_actions = history.model_actions()
             model_thoughts = history.model_thoughts()
-            
+
             if not model_actions:
                 return
-            
-            # Get current URL
-            current_url = ""
+
+            # Get current URL (keep the cached one if the lookup fails)
             try:
                 urls = history.urls()
                 if urls:
-                    current_url = urls[-1] if urls else ""
+                    self.current_url = urls[-1]
             except Exception:
                 pass
-            
-            # Record actions we haven't recorded yet
-            for i, action in enumerate(model_actions):
-                step_num = i + 1
-                if step_num <= len(self.recorded_actions):
-                    continue
-                
-                self.current_step = step_num
+            current_url = self.current_url
+
+            # Record actions we haven't recorded yet, starting from the cursor.
+            # One timestamp per step-end tick; the actions land together anyway.
+            timestamp = datetime.now().isoformat()
+            n_thoughts = len(model_thoughts) if model_thoughts else 0
+            for i in range(len(self.recorded_actions), len(model_actions)):
+                action = model_actions[i]
+                self.current_step = i + 1
                 action_type, action_name, params = self._parse_action(action)
-                
+
                 # Extract AI thinking from thoughts
                 thinking = None
                 goal = None
                 memory = None
-                if model_thoughts and i < len(model_thoughts):
+                if i < n_thoughts:
                     thought = model_thoughts[i]
                     if thought:
                         # Extract thinking fields from AgentBrain
@@ -475,14 +780,16 @@ class UITestRecorder:
                         if hasattr(thought, "memory"):
                             memory = thought.memory
                 
-                # Extract element description
-                element_desc = self._extract_element_description(params)
+                # Extract element description (skip action types that never have one)
+                element_desc = None
+                if action_type not in _NO_ELEMENT_TYPES:
+                    element_desc = self._extract_element_description(params)
                 
                 recorded_action = RecordedAction(
                     action_type=action_type,
                     action_name=action_name,
                     parameters=params,
-                    timestamp=datetime.now().isoformat(),
+                    timestamp=timestamp,
                     step_number=self.current_step,
                     url=current_url,
                     thinking=thinking,
@@ -492,10 +799,10 @@ class UITestRecorder:
                 )
                 
                 self.recorded_actions.append(recorded_action)
-                print(f"  [Step {self.current_step}] Recorded: {action_name}")
-        
+                _step_logger.info(f"  [Step {self.current_step}] Recorded: {action_name}")
+
         except Exception as e:
-            print(f"  Warning: Failed to record action: {e}")
+            _step_logger.warning(f"  Warning: Failed to record action: {e}")
     
     async def record(
         self,
@@ -509,6 +816,8 @@ class UITestRecorder:
         """Record a test case by running an AI agent task"""
         self.recorded_actions = []
         self.current_step = 0
+        self.current_url = ""
+        self._seen_history_len = 0
         
         print(f"\n{'='*60}")
         print(f"Recording Test Case")
@@ -518,11 +827,9 @@ class UITestRecorder:
             print(f"Start URL: {start_url}")
         print(f"{'='*60}\n")
         
-        # Create browser - use headless parameter directly
-        browser = Browser(
-            headless=self.headless,
-        )
-        
+        # Reuse the lazily created browser; the caller owns its lifetime via close()
+        browser = self._get_browser()
+
         # If start_url is set, open it via initial_actions so the browser is not blank
         initial_actions = []
         if start_url:
@@ -536,31 +843,43 @@ class UITestRecorder:
         
         extend_system_message = ""
         if self.auto_skills and self.skills_dir:
-            skills = load_skills_dir(self.skills_dir)
+            skills = load_skills_dir(self.skills_dir, use_cache=self.skill_cache)
             prompt_preview = (task[:80] + "…") if len(task) > 80 else task
             print(f"[Skills] Matching skills for prompt: {prompt_preview!r}")
-            matched = match_skills(task, skills)
+            matched, top_score = match_skills(task, skills)
+            decisive = top_score >= DECISIVE_KEYWORD_SCORE
             if force_skill_id:
                 for s in skills:
                     if s.id == force_skill_id:
                         if s not in matched:
                             matched.insert(0, s)
+                        decisive = True
                         break
-            if matched:
+            if matched and decisive:
                 extend_system_message = build_extend_system_message(matched)
                 print(f"[Skills] Using skills: {[s.name for s in matched]}")
             else:
-                # No keyword match: ask LLM to pick by task + skill descriptions
-                try:
-                    print("[Skills] No keyword match; asking LLM to select skills from descriptions...")
-                    matched = await match_skills_with_llm(task, skills, self.llm_config, top_k=5)
-                    if matched:
-                        extend_system_message = build_extend_system_message(matched)
-                        print(f"[Skills] LLM selected: {[s.name for s in matched]}")
-                    else:
-                        print("[Skills] No skills matched (keyword or LLM).")
-                except Exception as e:
-                    print(f"[Skills] LLM selection failed: {e}; no skills will be used.")
+                # No decisive keyword match: try the local embedding index first, then the LLM
+                semantic = match_skills_semantic(task, skills, top_k=5)
+                if semantic:
+                    matched = semantic
+                    print(f"[Skills] Semantic match: {[s.name for s in matched]}")
+                else:
+                    try:
+                        print("[Skills] Keyword match not decisive; asking LLM to select skills from descriptions...")
+                        llm_matched = await match_skills_with_llm(
+                            task, skills, self.llm_config, top_k=5, skills_dir=self.skills_dir
+                        )
+                        if llm_matched:
+                            matched = llm_matched
+                            print(f"[Skills] LLM selected: {[s.name for s in matched]}")
+                    except Exception as e:
+                        print(f"[Skills] LLM selection failed: {e}")
+                if matched:
+                    extend_system_message = build_extend_system_message(matched)
+                    print(f"[Skills] Using skills: {[s.name for s in matched]}")
+                else:
+                    print("[Skills] No skills matched (keyword or LLM).")
         
         agent_kw: dict = dict(
             task=full_task,
@@ -582,13 +901,14 @@ class UITestRecorder:
             )
             
             # Create test case
-            test_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+            now = datetime.now()
+            test_id = now.strftime("%Y%m%d_%H%M%S")
             test_case = TestCase(
                 id=test_id,
                 name=test_name or f"Test_{test_id}",
                 description=description or task,
-                created_at=datetime.now().isoformat(),
-                updated_at=datetime.now().isoformat(),
+                created_at=now.isoformat(),
+                updated_at=now.isoformat(),
                 start_url=start_url,
                 actions=self.recorded_actions,
                 metadata={
@@ -600,7 +920,7 @@ class UITestRecorder:
                 }
             )
             
-            filepath = test_case.save(self.test_cases_dir)
+            filepath = await test_case.asave(self.test_cases_dir)
             
             print(f"\n{'='*60}")
             print(f"Recording Complete!")
@@ -615,13 +935,14 @@ class UITestRecorder:
         except (asyncio.CancelledError, KeyboardInterrupt):
             # Save partial recording so we can still generate skill from it
             if self.recorded_actions:
-                test_id = datetime.now().strftime("%Y%m%d_%H%M%S") + "_partial"
+                now = datetime.now()
+                test_id = now.strftime("%Y%m%d_%H%M%S") + "_partial"
                 self._partial_test_case = TestCase(
                     id=test_id,
                     name=test_name or f"Test_{test_id}",
                     description=description or task,
-                    created_at=datetime.now().isoformat(),
-                    updated_at=datetime.now().isoformat(),
+                    created_at=now.isoformat(),
+                    updated_at=now.isoformat(),
                     start_url=start_url,
                     actions=list(self.recorded_actions),
                     metadata={"task": task, "max_steps": max_steps, "partial": True},
@@ -632,7 +953,50 @@ class UITestRecorder:
                 self._partial_test_case = None
             raise
         finally:
-            await browser.stop()
+            _flush_step_log()
+
+
+class BrowserPool:
+    """Pool of warm browsers so repeated replays skip the Chromium cold start"""
+
+    def __init__(self, size: int = 3, headless: bool = False):
+        self.size = size
+        self.headless = headless
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._created = 0
+
+    async def acquire(self) -> Browser:
+        """Check out a browser, starting a fresh one while under capacity"""
+        if self._queue.empty() and self._created < self.size:
+            self._created += 1
+            return Browser(headless=self.headless)
+        return await self._queue.get()
+
+    async def release(self, browser: Browser) -> None:
+        """Return a browser to the pool after a best-effort state reset
+
+        Clears cookies and parks the page on about:blank so one replay's session
+        (e.g. a login) does not bleed into the next checkout.
+        """
+        try:
+            page = await browser.get_current_page()
+            context = getattr(page, "context", None)
+            if context is not None:
+                await context.clear_cookies()
+            await page.goto("about:blank")
+        except Exception:
+            pass
+        await self._queue.put(browser)
+
+    async def close_all(self) -> None:
+        """Stop every browser currently checked in"""
+        while not self._queue.empty():
+            browser = self._queue.get_nowait()
+            self._created -= 1
+            try:
+                await browser.stop()
+            except Exception:
+                pass
 
 
 class UITestPlayer:
@@ -651,33 +1015,48 @@ class UITestPlayer:
         self.manager = TestCaseManager(test_cases_dir)
         self.max_correction_attempts = max_correction_attempts
         self.replay_results: list[ReplayResult] = []
-    
+        # Browser is created lazily and reused across replay() calls
+        self._browser: Optional[Browser] = None
+        # Create the report directory once, not on every failure
+        self._report_dir = Path("replay_reports")
+        self._report_dir.mkdir(exist_ok=True)
+
+    def _get_browser(self) -> Browser:
+        """Return the shared browser, creating it on first use"""
+        if self._browser is None:
+            self._browser = Browser(headless=self.headless)
+        return self._browser
+
+    async def close(self):
+        """Stop the shared browser if it was started"""
+        if self._browser is not None:
+            browser, self._browser = self._browser, None
+            await browser.stop()
+
     def _generate_replay_task(self, test_case: TestCase, with_context: bool = True) -> str:
         """Generate a task description from recorded actions for replay"""
-        steps = []
-        
-        for i, action in enumerate(test_case.actions, 1):
-            action_desc = self._describe_action(action, with_context)
-            if action_desc:
-                steps.append(f"{i}. {action_desc}")
-        
-        if test_case.start_url:
-            steps.insert(0, f"0. Navigate to {test_case.start_url}")
-        
-        task = f"""Replay the following test case step by step:
+        def _steps():
+            if test_case.start_url:
+                yield f"0. Navigate to {test_case.start_url}"
+            for i, action in enumerate(test_case.actions, 1):
+                action_desc = self._describe_action(action, with_context)
+                if action_desc:
+                    yield f"{i}. {action_desc}"
+
+        steps_text = "\n".join(_steps())
+
+        return f"""Replay the following test case step by step:
 
 Test Name: {test_case.name}
 Description: {test_case.description}
 
 Steps to perform:
-{chr(10).join(steps)}
+{steps_text}
 
-IMPORTANT: 
+IMPORTANT:
 - Execute each step carefully
 - If an element's position has changed, try to find it by its attributes (id, name, class, text)
 - Report success or failure for each step"""
-        
-        return task
     
     def _generate_correction_task(
         self,
@@ -686,76 +1065,70 @@ IMPORTANT:
         current_url: str,
     ) -> str:
         """Generate a task to correct a failed action"""
-        task = f"""The previous action failed. Please try to complete the same goal using alternative methods.
+        # The action-specific prefix is static per action; only error/url vary per attempt
+        prefix = action._correction_prefix
+        if prefix is None:
+            prefix = f"""The previous action failed. Please try to complete the same goal using alternative methods.
 
 FAILED ACTION:
 - Type: {action.action_type}
 - Name: {action.action_name}
-- Original Parameters: {json.dumps(action.parameters, ensure_ascii=False)}
+- Original Parameters: {action.params_json}
 - Element Description: {action.element_description or 'N/A'}
 
 ORIGINAL GOAL: {action.goal or 'Complete the action'}
 
 ORIGINAL THINKING: {action.thinking or 'N/A'}
+"""
+            action._correction_prefix = prefix
 
+        return f"""{prefix}
 ERROR: {error}
 
 CURRENT URL: {current_url}
 
-INSTRUCTIONS:
-1. The element position may have changed but the functionality should be the same
-2. Try to find the element by:
-   - Text content / label
-   - ID or name attribute
-   - Class name
-   - XPath pattern
-   - Visual position relative to other elements
-3. If it's a click action, find and click the equivalent button/link
-4. If it's an input action, find and fill the equivalent input field
-5. Report whether the correction was successful"""
-        
-        return task
+{_CORRECTION_INSTRUCTIONS}"""
     
     def _describe_action(self, action: RecordedAction, with_context: bool = True) -> str:
         """Generate a human-readable description of an action"""
         params = action.parameters
         base_desc = ""
         
-        if action.action_type == ActionType.NAVIGATE.value:
+        if action.action_type == _AT_NAVIGATE:
             url = params.get("url", "")
             base_desc = f"Navigate to {url}"
         
-        elif action.action_type == ActionType.CLICK.value:
+        elif action.action_type == _AT_CLICK:
             if action.element_description:
                 base_desc = f"Click on element: {action.element_description}"
             else:
                 index = params.get("index", "")
                 base_desc = f"Click on element (index {index})" if index else "Click on element"
         
-        elif action.action_type == ActionType.TYPE.value:
+        elif action.action_type == _AT_TYPE:
             text = params.get("text", "")
             if action.element_description:
                 base_desc = f"Type '{text}' into: {action.element_description}"
             else:
                 base_desc = f"Type '{text}' into input field"
         
-        elif action.action_type == ActionType.SCROLL.value:
+        elif action.action_type == _AT_SCROLL:
             direction = params.get("direction", "down")
             base_desc = f"Scroll {direction}"
         
-        elif action.action_type == ActionType.SEND_KEYS.value:
+        elif action.action_type == _AT_SEND_KEYS:
             keys = params.get("keys", "")
             base_desc = f"Send keys: {keys}"
         
-        elif action.action_type == ActionType.SELECT.value:
+        elif action.action_type == _AT_SELECT:
             option = params.get("option", params.get("value", ""))
             base_desc = f"Select option '{option}'"
         
-        elif action.action_type == ActionType.WAIT.value:
+        elif action.action_type == _AT_WAIT:
             seconds = params.get("seconds", 1)
             base_desc = f"Wait for {seconds} seconds"
         
-        elif action.action_type == ActionType.EXTRACT.value:
+        elif action.action_type == _AT_EXTRACT:
             base_desc = "Extract/verify content"
         
         else:
@@ -772,9 +1145,14 @@ INSTRUCTIONS:
         test_id: str,
         max_steps: int = 100,
         auto_correct: bool = True,
+        browser: Optional[Browser] = None,
     ) -> dict:
-        """Replay a recorded test case with auto-correction"""
-        test_case = self.manager.get_test_case(test_id)
+        """Replay a recorded test case with auto-correction
+
+        When `browser` is given it is used as-is and its lifetime stays with the
+        caller; otherwise the instance's shared browser is used.
+        """
+        test_case = await self.manager.aget_test_case(test_id)
         if not test_case:
             raise ValueError(f"Test case not found: {test_id}")
         
@@ -790,8 +1168,9 @@ INSTRUCTIONS:
         
         self.replay_results = []
         
-        # Create browser
-        browser = Browser(headless=self.headless)
+        # Reuse the lazily created browser unless the caller supplied one
+        if browser is None:
+            browser = self._get_browser()
         llm = self.llm_config.create_llm()
         print(f"Using LLM: {self.llm_config.model}")
         
@@ -831,38 +1210,42 @@ INSTRUCTIONS:
             
             # Track correction attempts
             correction_log = []
-            
+            n_actions = len(test_case.actions)
+
             async def on_step_end_with_correction(agent: Agent):
                 """Monitor steps and attempt corrections if needed"""
-                nonlocal correction_log
-                
                 history = agent.history
                 if not history:
                     return
-                
-                # Check for errors in the last step
+
+                # One errors() call per step; bail out fast when the last slot is clean
                 errors = history.errors()
-                if errors and errors[-1]:
-                    error_msg = str(errors[-1])
-                    step_num = len(errors)
-                    
-                    print(f"  [Step {step_num}] Error detected: {error_msg[:100]}...")
-                    
-                    if auto_correct and step_num <= len(test_case.actions):
-                        # Get the original action that failed
-                        original_action = test_case.actions[step_num - 1]
-                        
-                        # Log the correction attempt
-                        correction_info = {
-                            "step": step_num,
-                            "original_action": original_action.action_name,
-                            "error": error_msg,
-                            "timestamp": datetime.now().isoformat(),
-                            "thinking": original_action.thinking,
-                            "goal": original_action.goal,
-                        }
-                        correction_log.append(correction_info)
-                        print(f"  [Step {step_num}] Correction info logged")
+                last_error = errors[-1] if errors else None
+                if not last_error:
+                    return
+
+                error_msg = str(last_error)
+                step_num = len(errors)
+                _step_logger.info(f"  [Step {step_num}] Error detected: {error_msg[:100]}...")
+
+                if auto_correct and step_num <= n_actions:
+                    # Get the original action that failed
+                    original_action = test_case.actions[step_num - 1]
+
+                    # Log the correction attempt
+                    correction_info = {
+                        "step": step_num,
+                        "original_action": original_action.action_name,
+                        "error": error_msg,
+                        # Raw float here; ISO-formatted only if a report gets written
+                        "ts": time.time(),
+                        "thinking": original_action.thinking,
+                        "goal": original_action.goal,
+                        # Flipped to True once a correction is verified
+                        "success": False,
+                    }
+                    correction_log.append(correction_info)
+                    _step_logger.info(f"  [Step {step_num}] Correction info logged")
             
             history = await agent.run(
                 max_steps=max_steps,
@@ -873,9 +1256,11 @@ INSTRUCTIONS:
             results["success"] = history.is_successful() if history else False
             results["steps_executed"] = history.number_of_steps() if history else 0
             results["final_result"] = history.final_result() if history else None
-            results["errors"] = [str(e) for e in (history.errors() if history else []) if e]
+            # Only stringify error slots when the run actually failed
+            if history and not results["success"]:
+                results["errors"] = [str(e) for e in history.errors() if e]
             results["corrections"] = correction_log
-            results["steps_corrected"] = len([c for c in correction_log if "success" in str(c).lower()])
+            results["steps_corrected"] = sum(1 for c in correction_log if c["success"])
             
             # If replay failed, save failure report
             if not results["success"] and correction_log:
@@ -896,10 +1281,8 @@ INSTRUCTIONS:
             results["completed_at"] = datetime.now().isoformat()
             results["errors"].append(str(e))
             print(f"\nReplay failed with error: {e}")
-            
-        finally:
-            await browser.stop()
-        
+
+        _flush_step_log()
         return results
     
     def _save_failure_report(
@@ -907,11 +1290,22 @@ INSTRUCTIONS:
         test_case: TestCase,
         results: dict,
         correction_log: list,
+        pretty: Optional[bool] = None,
     ):
-        """Save detailed failure report for debugging"""
-        report_dir = Path("replay_reports")
-        report_dir.mkdir(exist_ok=True)
-        
+        """Save detailed failure report for debugging
+
+        Reports are machine-consumed, so they are written compact by default;
+        set REPLAY_REPORT_PRETTY=1 (or pass pretty=True) for indented output.
+        """
+        report_dir = self._report_dir
+
+        # Correction entries carry raw time.time() floats; format them here, on
+        # the failure path only
+        for entry in correction_log:
+            ts = entry.pop("ts", None)
+            if ts is not None:
+                entry["timestamp"] = datetime.fromtimestamp(ts).isoformat()
+
         report = {
             "test_case_id": test_case.id,
             "test_case_name": test_case.name,
@@ -919,24 +1313,17 @@ INSTRUCTIONS:
             "success": results["success"],
             "errors": results["errors"],
             "correction_attempts": correction_log,
-            "original_actions": [
-                {
-                    "step": a.step_number,
-                    "type": a.action_type,
-                    "name": a.action_name,
-                    "goal": a.goal,
-                    "thinking": a.thinking,
-                    "memory": a.memory,
-                    "element": a.element_description,
-                    "params": a.parameters,
-                }
-                for a in test_case.actions
-            ],
+            # Reuse the serialization shape TestCase already maintains instead of
+            # rebuilding a bespoke dict per action on the failure path
+            "original_actions": test_case.to_dict()["actions"],
         }
         
         report_path = report_dir / f"failure_{test_case.id}_{datetime.now().strftime('%H%M%S')}.json"
-        with open(report_path, "w", encoding="utf-8") as f:
-            json.dump(report, f, indent=2, ensure_ascii=False)
+        # Pre-serialize and emit in one write rather than streaming encoder tokens
+        if pretty is None:
+            pretty = os.getenv("REPLAY_REPORT_PRETTY", "").lower() in ("1", "true", "yes")
+        payload = _dumps_pretty(report) if pretty else _dumps_compact(report)
+        report_path.write_bytes(payload)
         
         print(f"Failure report saved to: {report_path}")
     
@@ -945,30 +1332,41 @@ INSTRUCTIONS:
         test_ids: list[str],
         max_steps: int = 100,
         auto_correct: bool = True,
+        max_parallel: int = 3,
     ) -> list[dict]:
-        """Replay multiple test cases"""
-        results = []
-        for test_id in test_ids:
-            try:
-                result = await self.replay(test_id, max_steps, auto_correct)
-                results.append(result)
-            except Exception as e:
-                results.append({
-                    "test_id": test_id,
-                    "success": False,
-                    "errors": [str(e)],
-                })
-        return results
+        """Replay multiple test cases, overlapping up to max_parallel browsers"""
+        sem = asyncio.Semaphore(max_parallel)
+        pool = BrowserPool(size=max_parallel, headless=self.headless)
+
+        async def _one(test_id: str) -> dict:
+            async with sem:
+                browser = await pool.acquire()
+                try:
+                    return await self.replay(test_id, max_steps, auto_correct, browser=browser)
+                except Exception as e:
+                    return {
+                        "test_id": test_id,
+                        "success": False,
+                        "errors": [str(e)],
+                    }
+                finally:
+                    await pool.release(browser)
+
+        try:
+            return list(await asyncio.gather(*(_one(t) for t in test_ids)))
+        finally:
+            await pool.close_all()
+            await self.close()
 
 
 async def resolve_record_inputs(record_args: dict) -> dict:
     """Resolve task, start_url, test_name from record_args (prompts/inference as needed). Returns dict for both skill-creator and record."""
     task = record_args.get("task")
     if not task:
-        task = input("Enter the task description: ").strip()
+        task = (await _ainput("Enter the task description: ")).strip()
     if not task:
         raise ValueError("Task is required.")
-    llm_config = LLMConfig.from_env()
+    llm_config = _cached_llm_config()
     start_url = record_args.get("start_url")
     if not (start_url and str(start_url).strip()):
         extracted = extract_url_from_prompt(task)
@@ -981,14 +1379,14 @@ async def resolve_record_inputs(record_args: dict) -> dict:
                 start_url = inferred
                 print(f"Using URL from task (AI): {start_url}")
             elif start_url is None:
-                start_url = input("Enter start URL (optional): ").strip()
+                start_url = (await _ainput("Enter start URL (optional): ")).strip()
             else:
                 start_url = ""
     if start_url is None:
         start_url = ""
     test_name = record_args.get("test_name")
     if test_name is None:
-        test_name = input("Enter test name (optional): ").strip()
+        test_name = (await _ainput("Enter test name (optional): ")).strip()
     if test_name is None:
         test_name = ""
     return {"task": task, "start_url": (start_url or "").strip(), "test_name": test_name or "", "llm_config": llm_config}
@@ -1003,14 +1401,14 @@ async def run_skill_creator_flow(record_args: dict, resolved: Optional[dict] = N
     else:
         task = record_args.get("task")
         if not task:
-            task = input("Enter the record topic (task description): ").strip()
+            task = (await _ainput("Enter the record topic (task description): ")).strip()
         if not task:
             print("Task is required for --skill-creator.")
             return
         start_url = record_args.get("start_url") or ""
         if start_url is None:
-            start_url = input("Enter start URL (optional): ").strip() or ""
-        llm_config = LLMConfig.from_env()
+            start_url = (await _ainput("Enter start URL (optional): ")).strip() or ""
+        llm_config = _cached_llm_config()
     skills_dir = record_args.get("skills_dir") or "skills"
     print(f"Using LLM: {llm_config.model}")
     print(f"Generating parameterized skill for: {task}")
@@ -1028,6 +1426,7 @@ async def do_record(
     skills_dir: str = "skills",
     no_auto_skills: bool = False,
     force_skill: Optional[str] = None,
+    no_skill_cache: bool = False,
 ):
     """Run browser record with already-resolved task/start_url/test_name. Shared by record-only and skill-creator+record."""
     task = resolved["task"]
@@ -1043,6 +1442,7 @@ async def do_record(
         llm_config=llm_config,
         skills_dir=skills_dir or "skills",
         auto_skills=not no_auto_skills,
+        skill_cache=not no_skill_cache,
     )
     try:
         test_case = await recorder.record(
@@ -1060,6 +1460,8 @@ async def do_record(
         if partial is not None:
             return partial
         raise
+    finally:
+        await recorder.close()
 
 
 async def interactive_record(
@@ -1113,7 +1515,7 @@ async def interactive_replay(test_id: Optional[str] = None, headless: bool = Fal
         for i, tc in enumerate(test_cases, 1):
             print(f"  {i}. [{tc.id}] {tc.name} - {len(tc.actions)} actions")
         
-        selection = input("\nEnter test ID or number: ").strip()
+        selection = (await _ainput("\nEnter test ID or number: ")).strip()
         
         try:
             idx = int(selection) - 1
@@ -1124,35 +1526,73 @@ async def interactive_replay(test_id: Optional[str] = None, headless: bool = Fal
         except ValueError:
             test_id = selection
     
-    llm_config = LLMConfig.from_env()
+    llm_config = _cached_llm_config()
     print(f"Using LLM: {llm_config.model}")
     
     player = UITestPlayer(headless=headless, llm_config=llm_config)
-    results = await player.replay(test_id, auto_correct=True)
-    
+    try:
+        results = await player.replay(test_id, auto_correct=True)
+    finally:
+        await player.close()
+
     return results
 
 
+def _trunc(s: str, n: int) -> str:
+    """Truncate a preview string, allocating only when it is actually too long"""
+    return s if len(s) <= n else s[:n] + "..."
+
+
+@functools.lru_cache(maxsize=8)
+def _load_skills_cached(skills_dir: str, mtime_ns: int):
+    """Skills for a directory, cached per process on the directory mtime"""
+    return load_skills_dir(skills_dir)
+
+
+@functools.lru_cache(maxsize=8)
+def _skill_tree_cached(skills_dir: str, mtime_ns: int):
+    """Skill tree built from the cached skills for the same mtime key"""
+    return build_skill_tree(_load_skills_cached(skills_dir, mtime_ns), skills_dir)
+
+
+# Nested-parameter action keys and the action type each one maps to (for view)
+ACTION_KEY_TO_TYPE = {
+    "navigate": "navigate",
+    "click": "click",
+    "input": "type",
+    "scroll": "scroll",
+    "wait": "wait",
+    "done": "extract",
+    "send_keys": "send_keys",
+    "extract": "extract",
+}
+
+
 def list_skills(skills_dir: str = "skills"):
     """List all local skills (tree) and their name/description."""
-    skills = load_skills_dir(skills_dir)
+    try:
+        mtime_ns = os.stat(skills_dir).st_mtime_ns
+    except OSError:
+        mtime_ns = 0
+    skills = _load_skills_cached(skills_dir, mtime_ns)
     if not skills:
         print(f"\nNo skills found in {skills_dir}/")
         return
-    tree = build_skill_tree(skills, skills_dir)
-    print(f"\n{'='*60}\nSkills ({skills_dir}/)\n{'='*60}")
+    tree = _skill_tree_cached(skills_dir, mtime_ns)
+    parts = [f"\n{'='*60}\nSkills ({skills_dir}/)\n{'='*60}\n"]
     def _walk(node: SkillTreeNode, prefix: str):
         for i, child in enumerate(node.children):
             is_last = i == len(node.children) - 1
             branch = "└── " if is_last else "├── "
             skill_info = f" ({child.skill.name})" if child.skill else ""
-            print(f"{prefix}{branch}{child.name}{skill_info}")
+            parts.append(f"{prefix}{branch}{child.name}{skill_info}\n")
             if child.skill and child.skill.description:
-                desc = (child.skill.description[:60] + "...") if len(child.skill.description) > 60 else child.skill.description
-                print(f"{prefix}    {'    ' if is_last else '│   '}  {desc}")
+                desc = _trunc(child.skill.description, 60)
+                parts.append(f"{prefix}    {'    ' if is_last else '│   '}  {desc}\n")
             _walk(child, prefix + ("    " if is_last else "│   "))
     _walk(tree, "")
-    print(f"\nTotal: {len(skills)} skill(s)\n")
+    parts.append(f"\nTotal: {len(skills)} skill(s)\n")
+    sys.stdout.write("".join(parts))
 
 
 def list_test_cases():
@@ -1164,20 +1604,22 @@ def list_test_cases():
         print("\nNo test cases found!")
         return
     
-    print("\n" + "="*60)
-    print("Saved Test Cases")
-    print("="*60)
-    
+    parts = ["\n" + "="*60 + "\n", "Saved Test Cases\n", "="*60 + "\n"]
+
     for tc in test_cases:
-        print(f"\n  ID: {tc.id}")
-        print(f"  Name: {tc.name}")
-        print(f"  Description: {tc.description[:50]}..." if len(tc.description) > 50 else f"  Description: {tc.description}")
-        print(f"  Actions: {len(tc.actions)}")
-        print(f"  Created: {tc.created_at}")
-        print(f"  Start URL: {tc.start_url}")
-        print("-"*40)
-    
-    print(f"\nTotal: {len(test_cases)} test case(s)\n")
+        desc = _trunc(tc.description, 50)
+        parts.append(
+            f"\n  ID: {tc.id}\n"
+            f"  Name: {tc.name}\n"
+            f"  Description: {desc}\n"
+            f"  Actions: {len(tc.actions)}\n"
+            f"  Created: {tc.created_at}\n"
+            f"  Start URL: {tc.start_url}\n"
+        )
+        parts.append("-"*40 + "\n")
+
+    parts.append(f"\nTotal: {len(test_cases)} test case(s)\n")
+    sys.stdout.write("".join(parts))
 
 
 def view_test_case(test_id: str):
@@ -1189,18 +1631,19 @@ def view_test_case(test_id: str):
         print(f"\nTest case not found: {test_id}")
         return
     
-    print("\n" + "="*60)
-    print(f"Test Case: {tc.name}")
-    print("="*60)
-    print(f"ID: {tc.id}")
-    print(f"Description: {tc.description}")
-    print(f"Start URL: {tc.start_url}")
-    print(f"Created: {tc.created_at}")
-    print(f"Updated: {tc.updated_at}")
-    
-    print(f"\nActions ({len(tc.actions)}):")
-    print("-"*40)
-    
+    parts = [
+        "\n" + "="*60 + "\n",
+        f"Test Case: {tc.name}\n",
+        "="*60 + "\n",
+        f"ID: {tc.id}\n",
+        f"Description: {tc.description}\n",
+        f"Start URL: {tc.start_url}\n",
+        f"Created: {tc.created_at}\n",
+        f"Updated: {tc.updated_at}\n",
+        f"\nActions ({len(tc.actions)}):\n",
+        "-"*40 + "\n",
+    ]
+
     for action in tc.actions:
         action_type = action.action_type
         action_name = action.action_name
@@ -1208,47 +1651,44 @@ def view_test_case(test_id: str):
         
         # Try to extract action from nested parameters
         if action_type == "unknown" and isinstance(params, dict):
-            for key in ["navigate", "click", "input", "scroll", "wait", "done", "send_keys", "extract"]:
-                if key in params:
-                    action_name = key
-                    action_type = {
-                        "navigate": "navigate", "click": "click", "input": "type",
-                        "scroll": "scroll", "wait": "wait", "done": "extract",
-                        "send_keys": "send_keys", "extract": "extract"
-                    }.get(key, "unknown")
-                    params = params[key]
-                    break
-        
-        print(f"\n  Step {action.step_number}: [{action_type}] {action_name}")
+            found = next(iter(ACTION_KEY_TO_TYPE.keys() & params.keys()), None)
+            if found is not None:
+                action_name = found
+                action_type = ACTION_KEY_TO_TYPE[found]
+                params = params[found]
         
+        parts.append(f"\n  Step {action.step_number}: [{action_type}] {action_name}\n")
+
         # Show parameters
         if params and isinstance(params, dict):
-            display_params = {k: v for k, v in params.items() if not k.startswith("_")}
+            # Only rebuild the dict when there is actually a private key to hide
+            # (k[:1] rather than k[0]: params can hold arbitrary user-edited keys,
+            # including empty strings)
+            if any(k[:1] == "_" for k in params):
+                display_params = {k: v for k, v in params.items() if k[:1] != "_"}
+            else:
+                display_params = params
             if display_params:
-                params_str = json.dumps(display_params, ensure_ascii=False)
-                if len(params_str) > 80:
-                    params_str = params_str[:80] + "..."
-                print(f"    Parameters: {params_str}")
-        
+                parts.append(f"    Parameters: {_trunc(_json_dumps_str(display_params), 80)}\n")
+
         # Show element description
         if action.element_description:
-            print(f"    Element: {action.element_description[:60]}...")
-        
+            parts.append(f"    Element: {_trunc(action.element_description, 60)}\n")
+
         # Show AI thinking
         if action.goal:
-            print(f"    Goal: {action.goal}")
+            parts.append(f"    Goal: {action.goal}\n")
         if action.thinking:
-            thinking_preview = action.thinking[:60] + "..." if len(str(action.thinking)) > 60 else action.thinking
-            print(f"    Thinking: {thinking_preview}")
-        
+            parts.append(f"    Thinking: {_trunc(action.thinking, 60)}\n")
+
         if action.url:
-            url_display = action.url[:60] + "..." if len(action.url) > 60 else action.url
-            print(f"    URL: {url_display}")
-        
+            parts.append(f"    URL: {_trunc(action.url, 60)}\n")
+
         if action.error:
-            print(f"    Error: {action.error}")
-    
-    print("\n" + "="*60 + "\n")
+            parts.append(f"    Error: {action.error}\n")
+
+    parts.append("\n" + "="*60 + "\n\n")
+    sys.stdout.write("".join(parts))
 
 
 def delete_test_case(test_id: str):
@@ -1284,6 +1724,7 @@ Record Options:
   --skill-creator       Generate a parameterized skill for this topic, then run record (skill first, then browser)
   --skills-dir <path>   Skills directory (default: skills)
   --no-auto-skills      Disable auto-matching of skills from prompt
+  --no-skill-cache      Bypass the parsed-skills cache (always re-read SKILL.md files)
   -s, --skill <id>      Force-include skill by id (e.g. login)
 
 Examples:
@@ -1321,6 +1762,26 @@ Auto-Correction:
 """)
 
 
+# flag -> (result key, takes a value); one dict lookup per CLI token
+_FLAGS: dict[str, tuple[str, bool]] = {
+    "-p": ("task", True),
+    "--prompt": ("task", True),
+    "-t": ("task", True),
+    "--task": ("task", True),
+    "-u": ("start_url", True),
+    "--url": ("start_url", True),
+    "-n": ("test_name", True),
+    "--name": ("test_name", True),
+    "--headless": ("headless", False),
+    "--skill-creator": ("skill_creator", False),
+    "--skills-dir": ("skills_dir", True),
+    "--no-auto-skills": ("no_auto_skills", False),
+    "--no-skill-cache": ("no_skill_cache", False),
+    "-s": ("force_skill", True),
+    "--skill": ("force_skill", True),
+}
+
+
 def parse_record_args(args: list[str]) -> dict:
     """Parse record command arguments"""
     result = {
@@ -1331,60 +1792,41 @@ def parse_record_args(args: list[str]) -> dict:
         "skill_creator": False,
         "skills_dir": "skills",
         "no_auto_skills": False,
+        "no_skill_cache": False,
         "force_skill": None,
     }
-    
+
     i = 0
-    while i < len(args):
+    n = len(args)
+    while i < n:
         arg = args[i]
-        
-        if arg in ("-p", "--prompt", "-t", "--task"):
-            if i + 1 < len(args):
-                result["task"] = args[i + 1]
-                i += 2
-                continue
-        elif arg in ("-u", "--url"):
-            if i + 1 < len(args):
-                result["start_url"] = args[i + 1]
-                i += 2
-                continue
-        elif arg in ("-n", "--name"):
-            if i + 1 < len(args):
-                result["test_name"] = args[i + 1]
-                i += 2
-                continue
-        elif arg in ("--headless",):
-            result["headless"] = True
-            i += 1
-            continue
-        elif arg in ("--skill-creator",):
-            result["skill_creator"] = True
-            i += 1
-            continue
-        elif arg in ("--skills-dir",):
-            if i + 1 < len(args):
-                result["skills_dir"] = args[i + 1]
-                i += 2
-                continue
-        elif arg in ("--no-auto-skills",):
-            result["no_auto_skills"] = True
+        spec = _FLAGS.get(arg)
+        if spec is None:
+            # Bare positional: first non-flag token becomes the task
+            if result["task"] is None and not arg.startswith("-"):
+                result["task"] = arg
             i += 1
             continue
-        elif arg in ("-s", "--skill",):
-            if i + 1 < len(args):
-                result["force_skill"] = args[i + 1]
+        attr, takes_value = spec
+        if takes_value:
+            if i + 1 < n:
+                result[attr] = args[i + 1]
                 i += 2
-                continue
+            else:
+                i += 1
         else:
-            if result["task"] is None and not arg.startswith("-"):
-                result["task"] = arg
-        i += 1
-    
+            result[attr] = True
+            i += 1
+
     return result
 
 
 async def main_async(args: list[str]):
     """Main async entry point"""
+    # Run synchronously-completing coroutines without a scheduler round-trip (3.12+)
+    if hasattr(asyncio, "eager_task_factory"):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
     if not args or args[0] == "help":
         print_help()
         return
@@ -1408,6 +1850,7 @@ async def main_async(args: list[str]):
             skills_dir=skills_dir,
             no_auto_skills=no_auto_skills,
             force_skill=force_skill,
+            no_skill_cache=record_args.get("no_skill_cache", False),
         )
         if record_args.get("skill_creator"):
             print("\n" + "="*60)
@@ -1418,13 +1861,16 @@ async def main_async(args: list[str]):
                 if not test_case.actions:
                     print("\nNo actions recorded; skipping skill generation (run record until steps are captured).")
                 else:
+                    # Kick the LLM call off immediately so it overlaps any remaining
+                    # teardown instead of waiting for it
+                    skill_task = asyncio.create_task(run_skill_creator_from_record(
+                        test_case.to_dict(),
+                        skills_dir=skills_dir,
+                        llm_config=resolved["llm_config"],
+                    ))
                     print(f"\n[Skill-creator] Generating skill from {len(test_case.actions)} recorded actions (LLM: {resolved['llm_config'].model})...")
                     try:
-                        path = await run_skill_creator_from_record(
-                            test_case.to_dict(),
-                            skills_dir=skills_dir,
-                            llm_config=resolved["llm_config"],
-                        )
+                        path = await skill_task
                         print(f"\nSkill (from recording) written to: {path}")
                     except Exception as e:
                         print(f"Skill-creator from record failed: {e}")
@@ -1456,7 +1902,7 @@ async def main_async(args: list[str]):
         if len(args) < 2:
             print("Usage: delete <test_id>")
             return
-        confirm = input(f"Are you sure you want to delete '{args[1]}'? (y/N): ").strip().lower()
+        confirm = (await _ainput(f"Are you sure you want to delete '{args[1]}'? (y/N): ")).strip().lower()
         if confirm == "y":
             delete_test_case(args[1])
     
@@ -1468,6 +1914,12 @@ async def main_async(args: list[str]):
 def main():
     """Main entry point"""
     import sys
+    # Use the libuv-backed loop when available; drop-in for the selector loop
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
     args = sys.argv[1:] if len(sys.argv) > 1 else []
     asyncio.run(main_async(args))
 